@@ -1,20 +1,43 @@
 import sys
 import os
-from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QTabWidget, QFileDialog, QGridLayout, QFrame, QDialog, QDialogButtonBox, QScrollArea, QComboBox
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from PyQt5.QtGui import QPixmap, QImageReader, QIcon
+from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QTabWidget, QFileDialog, QGridLayout, QFrame, QDialog, QDialogButtonBox, QScrollArea, QComboBox, QTableWidget, QTableWidgetItem, QSizePolicy
+from PyQt5.QtCore import Qt, QThread, QThreadPool, QRunnable, QObject, QTimer, pyqtSignal
+from PyQt5.QtGui import QPixmap, QPixmapCache, QImage, QImageReader, QImageIOHandler, QIcon
 
 # Global variables for image viewer
 image_paths = []  # Store image paths
 selected_images = set()  # Store selected image paths
-image_cache = {}  # Cache to store preloaded images
 
 # Limit the number of images to display at once
 MAX_IMAGES_TO_DISPLAY = 50
 
+# File extensions shown in the image viewer
+IMAGE_EXTS = frozenset({'.png', '.jpg', '.jpeg', '.bmp'})
+
+# Byte budget (in KB) for Qt's pixmap cache, which holds the preloaded thumbnails
+PIXMAP_CACHE_LIMIT_KB = 256 * 1024
+
+# Number of image paths sent to the UI per signal while a directory is being scanned
+IMAGE_BATCH_SIZE = 8
+
+# Longest number accepted in an input field; keeps int() within its digit limit and results within float range
+MAX_INT_FIELD_DIGITS = 18
+
+# Limit the number of values per axis in the epoch sweep table
+MAX_SWEEP_VALUES = 64
+
+# Number of thumbnails per row in the image grid
+IMAGES_PER_ROW = 5
+
+# Smallest thumbnail edge, used when the grid viewport has not been laid out yet
+MIN_THUMBNAIL_SIZE = 128
+
 # Get the directory where the script is located
 SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))  # Directory where the code is located
 
+# Window icon shipped next to the script (bundled alongside it by epoch_calculator.spec)
+ICON_PATH = os.path.join(SCRIPT_DIR, "default.ico")
+
 # Create a "themes" directory inside the current directory if it doesn't exist
 themes_dir = os.path.join(SCRIPT_DIR, "themes")
 if not os.path.exists(themes_dir):
@@ -22,6 +45,26 @@ if not os.path.exists(themes_dir):
 
 # Define folder names related to dataset
 DATASET_FOLDER_NAMES = ['AI', 'Dataset', 'DATASETS']
+DATASET_FOLDER_NAMES_LOWER = frozenset(name.lower() for name in DATASET_FOLDER_NAMES)
+
+def thumbnail_cache_key(img_path, cell_w):
+    """ QPixmapCache key for a thumbnail decoded at the given cell size. """
+    return f"{img_path}|{cell_w}"
+
+
+def parse_int_field(text, default=0):
+    """ Parse a non-negative integer field without raising; returns None for non-numeric or over-long input. """
+    text = text.strip()
+    if text.isdecimal() and len(text) <= MAX_INT_FIELD_DIGITS:
+        return int(text)
+    return default if not text else None
+
+
+def compute_epoch_grid(images, repeats_values, batch_values, steps):
+    """ Optimal epochs for every (repeats, batch size) pair, one row per repeats value. """
+    steps_per_image = steps / images
+    return [[steps_per_image * batch / repeats for batch in batch_values] for repeats in repeats_values]
+
 
 class EpochCalculator(QWidget):
     def __init__(self):
@@ -58,26 +101,139 @@ class EpochCalculator(QWidget):
 
         self.setLayout(self.layout)
 
+        # Recalculate shortly after the last edit so a burst of keystrokes triggers a single update
+        self.calculate_timer = QTimer(self)
+        self.calculate_timer.setSingleShot(True)
+        self.calculate_timer.setInterval(50)
+        self.calculate_timer.timeout.connect(self.calculate_epochs)
+
         # Connect input fields to dynamically update the result
-        self.images_entry.textChanged.connect(self.calculate_epochs)
-        self.repeats_entry.textChanged.connect(self.calculate_epochs)
-        self.batch_entry.textChanged.connect(self.calculate_epochs)
-        self.steps_entry.textChanged.connect(self.calculate_epochs)
+        self.images_entry.textChanged.connect(self.calculate_timer.start)
+        self.repeats_entry.textChanged.connect(self.calculate_timer.start)
+        self.batch_entry.textChanged.connect(self.calculate_timer.start)
+        self.steps_entry.textChanged.connect(self.calculate_timer.start)
 
     def calculate_epochs(self):
-        try:
-            images = int(self.images_entry.text()) if self.images_entry.text() else 0
-            repeats = int(self.repeats_entry.text()) if self.repeats_entry.text() else 0
-            batch = int(self.batch_entry.text()) if self.batch_entry.text() else 0
-            steps = int(self.steps_entry.text()) if self.steps_entry.text() else 2000  # Default to 2000 steps
-
-            if images > 0 and repeats > 0 and batch > 0:
-                total_epochs = (steps * batch) / (images * repeats)
-                self.result_label.setText(f"Optimal Epochs: {total_epochs:.2f}")
-            else:
-                self.result_label.setText("Enter valid positive integers.")
-        except ValueError:
+        images = parse_int_field(self.images_entry.text())
+        repeats = parse_int_field(self.repeats_entry.text())
+        batch = parse_int_field(self.batch_entry.text())
+        steps = parse_int_field(self.steps_entry.text(), 2000)  # Default to 2000 steps
+
+        if None in (images, repeats, batch, steps):
+            self.result_label.setText("Invalid input. Enter integers only.")
+        elif images > 0 and repeats > 0 and batch > 0:
+            total_epochs = (steps * batch) / (images * repeats)
+            self.result_label.setText(f"Optimal Epochs: {total_epochs:.2f}")
+        else:
+            self.result_label.setText("Enter valid positive integers.")
+
+    def update_image_count(self, image_count):
+        """ Method to update the number of images entry. """
+        self.images_entry.setText(str(image_count))
+
+
+class EpochSweep(QWidget):
+    def __init__(self):
+        super().__init__()
+
+        # Set up the layout for the epoch sweep
+        self.layout = QVBoxLayout()
+
+        # Labels and inputs for the sweep ranges
+        self.images_label = QLabel("Number of Images:")
+        self.images_entry = QLineEdit(self)
+
+        self.steps_label = QLabel("Target Steps:")
+        self.steps_entry = QLineEdit(self)
+        self.steps_entry.setText("2000")  # Set default steps to 2000
+
+        self.repeats_label = QLabel("Repeats (from - to):")
+        self.repeats_from_entry = QLineEdit(self)
+        self.repeats_from_entry.setText("1")
+        self.repeats_to_entry = QLineEdit(self)
+        self.repeats_to_entry.setText("10")
+        self.repeats_row = QHBoxLayout()
+        self.repeats_row.addWidget(self.repeats_from_entry)
+        self.repeats_row.addWidget(self.repeats_to_entry)
+
+        self.batch_label = QLabel("Batch Size (from - to):")
+        self.batch_from_entry = QLineEdit(self)
+        self.batch_from_entry.setText("1")
+        self.batch_to_entry = QLineEdit(self)
+        self.batch_to_entry.setText("8")
+        self.batch_row = QHBoxLayout()
+        self.batch_row.addWidget(self.batch_from_entry)
+        self.batch_row.addWidget(self.batch_to_entry)
+
+        self.result_label = QLabel("Optimal Epochs per Repeats (rows) and Batch Size (columns):")
+        self.result_table = QTableWidget(self)
+
+        self.layout.addWidget(self.images_label)
+        self.layout.addWidget(self.images_entry)
+        self.layout.addWidget(self.steps_label)
+        self.layout.addWidget(self.steps_entry)
+        self.layout.addWidget(self.repeats_label)
+        self.layout.addLayout(self.repeats_row)
+        self.layout.addWidget(self.batch_label)
+        self.layout.addLayout(self.batch_row)
+        self.layout.addWidget(self.result_label)
+        self.layout.addWidget(self.result_table)
+
+        self.setLayout(self.layout)
+
+        # Recalculate shortly after the last edit so a burst of keystrokes triggers a single update
+        self.calculate_timer = QTimer(self)
+        self.calculate_timer.setSingleShot(True)
+        self.calculate_timer.setInterval(50)
+        self.calculate_timer.timeout.connect(self.calculate_sweep)
+
+        # Connect input fields to dynamically update the table
+        for entry in (self.images_entry, self.steps_entry, self.repeats_from_entry,
+                      self.repeats_to_entry, self.batch_from_entry, self.batch_to_entry):
+            entry.textChanged.connect(self.calculate_timer.start)
+
+    def calculate_sweep(self):
+        images = parse_int_field(self.images_entry.text())
+        steps = parse_int_field(self.steps_entry.text(), 2000)  # Default to 2000 steps
+        repeats_from = parse_int_field(self.repeats_from_entry.text())
+        repeats_to = parse_int_field(self.repeats_to_entry.text())
+        batch_from = parse_int_field(self.batch_from_entry.text())
+        batch_to = parse_int_field(self.batch_to_entry.text())
+
+        self.result_table.clear()
+        self.result_table.setRowCount(0)
+        self.result_table.setColumnCount(0)
+
+        if None in (images, steps, repeats_from, repeats_to, batch_from, batch_to):
             self.result_label.setText("Invalid input. Enter integers only.")
+            return
+        if images <= 0 or repeats_from <= 0 or batch_from <= 0 or repeats_to < repeats_from or batch_to < batch_from:
+            self.result_label.setText("Enter valid positive integers, with each range from low to high.")
+            return
+
+        # Keep the table a manageable size
+        repeats_values = range(repeats_from, min(repeats_to, repeats_from + MAX_SWEEP_VALUES - 1) + 1)
+        batch_values = range(batch_from, min(batch_to, batch_from + MAX_SWEEP_VALUES - 1) + 1)
+        try:
+            grid = compute_epoch_grid(images, repeats_values, batch_values, steps)
+        except OverflowError:
+            self.result_label.setText("Values too large. Enter smaller integers.")
+            return
+
+        if len(repeats_values) < repeats_to - repeats_from + 1 or len(batch_values) < batch_to - batch_from + 1:
+            self.result_label.setText(f"Range too large. Displaying the first {MAX_SWEEP_VALUES} values per axis.")
+        else:
+            self.result_label.setText("Optimal Epochs per Repeats (rows) and Batch Size (columns):")
+
+        self.result_table.setUpdatesEnabled(False)
+        self.result_table.setRowCount(len(repeats_values))
+        self.result_table.setColumnCount(len(batch_values))
+        self.result_table.setVerticalHeaderLabels([str(repeats) for repeats in repeats_values])
+        self.result_table.setHorizontalHeaderLabels([str(batch) for batch in batch_values])
+        for row, epochs_row in enumerate(grid):
+            for col, epochs in enumerate(epochs_row):
+                self.result_table.setItem(row, col, QTableWidgetItem(f"{epochs:.2f}"))
+        self.result_table.setUpdatesEnabled(True)
 
     def update_image_count(self, image_count):
         """ Method to update the number of images entry. """
@@ -85,27 +241,89 @@ class EpochCalculator(QWidget):
 
 
 class ImageLoaderThread(QThread):
-    # Signal to send the loaded image paths and a completion flag
-    image_loaded_signal = pyqtSignal(list, bool)
+    # Signal to stream small batches of image paths while scanning
+    image_loaded_signal = pyqtSignal(list)
+    # Signal to send the completion flag once scanning is done
+    loading_finished_signal = pyqtSignal(bool)
 
-    def __init__(self, directory):
-        super().__init__()
+    def __init__(self, directory, parent=None):
+        super().__init__(parent)
         self.directory = directory
 
     def run(self):
-        # Load the images in the background
-        loaded_image_paths = [
-            os.path.join(self.directory, f)
-            for f in os.listdir(self.directory)
-            if f.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp'))
-        ]
-        
-        # Limit the number of images if necessary
-        if len(loaded_image_paths) > MAX_IMAGES_TO_DISPLAY:
-            loaded_image_paths = loaded_image_paths[:MAX_IMAGES_TO_DISPLAY]
-            self.image_loaded_signal.emit(loaded_image_paths, False)
-        else:
-            self.image_loaded_signal.emit(loaded_image_paths, True)
+        # Load the images in the background; scandir entries carry the file type, saving a stat per file
+        batch = []
+        found = 0
+        all_loaded = True
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if self.isInterruptionRequested():
+                    return
+                name = entry.name
+                if name[name.rfind('.'):].lower() in IMAGE_EXTS and entry.is_file():
+                    # Stop scanning once we know the limit is exceeded; one extra image tells us that
+                    if found == MAX_IMAGES_TO_DISPLAY:
+                        all_loaded = False
+                        break
+                    found += 1
+                    batch.append(entry.path)
+                    if len(batch) == IMAGE_BATCH_SIZE:
+                        self.image_loaded_signal.emit(batch)
+                        batch = []
+
+        if batch:
+            self.image_loaded_signal.emit(batch)
+        self.loading_finished_signal.emit(all_loaded)
+
+
+def read_thumbnail(img_path, cell_w):
+    """ Decode an image straight to grid cell size. Safe to call off the GUI thread. """
+    reader = QImageReader(img_path)
+    reader.setAutoTransform(True)
+    size = reader.size()
+    if size.isValid():
+        # Let the image plugin decode straight to the cell size (DCT scaling for JPEG)
+        size.scale(cell_w, cell_w, Qt.KeepAspectRatio)
+        reader.setScaledSize(size)
+    image = reader.read()
+    if image.isNull():
+        # Fall back to a plain QImage load for files QImageReader cannot decode at a scaled size
+        image = QImage(img_path)
+
+    if image.width() > cell_w or image.height() > cell_w:
+        image = image.scaled(cell_w, cell_w, Qt.KeepAspectRatio, Qt.FastTransformation)
+    return image
+
+
+class ThumbnailSignals(QObject):
+    # Signal to send a decoded thumbnail back to the GUI thread (null image on failure)
+    thumbnail_loaded_signal = pyqtSignal(str, int, QImage)
+
+
+class ThumbnailLoader(QRunnable):
+    """ Decode a single thumbnail in the global thread pool. """
+    def __init__(self, img_path, cell_w, signals):
+        super().__init__()
+        self.img_path = img_path
+        self.cell_w = cell_w
+        self.signals = signals
+
+    def run(self):
+        image = read_thumbnail(self.img_path, self.cell_w)
+        self.signals.thumbnail_loaded_signal.emit(self.img_path, self.cell_w, image)
+
+
+class ClickableLabel(QLabel):
+    """ Grid label that emits its image path when clicked. """
+    clicked = pyqtSignal(str)
+
+    def __init__(self, img_path, parent=None):
+        super().__init__(parent)
+        # Keep the path in Qt's property map rather than a Python attribute on every label
+        self.setProperty("img_path", img_path)
+
+    def mousePressEvent(self, event):
+        self.clicked.emit(self.property("img_path"))
 
 
 class ImageViewer(QWidget):
@@ -136,6 +354,10 @@ class ImageViewer(QWidget):
         self.scroll_area.setWidgetResizable(True)
         self.scroll_area.setWidget(self.image_frame)
 
+        # Only decode thumbnails once their row scrolls into view
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self.load_visible_thumbnails)
+        self.scroll_area.verticalScrollBar().rangeChanged.connect(self.load_visible_thumbnails)
+
         self.layout.addLayout(self.header)
         self.layout.addWidget(self.scroll_area)
 
@@ -143,6 +365,15 @@ class ImageViewer(QWidget):
 
         # Initialize the image paths
         self.image_paths = []
+        self.current_directory = None
+        self.loader_thread = None
+
+        # Grid labels waiting for their thumbnails, keyed by image path
+        self.thumbnail_labels = {}
+        self.thumbnail_cell_w = MIN_THUMBNAIL_SIZE
+        self.materialized_indices = set()  # Grid indices whose thumbnails were already requested
+        self.thumbnail_signals = ThumbnailSignals()
+        self.thumbnail_signals.thumbnail_loaded_signal.connect(self.on_thumbnail_loaded)
 
     def browse_directory(self):
         folder_path = QFileDialog.getExistingDirectory(self, "Select Directory", SCRIPT_DIR)  # Use SCRIPT_DIR as the base
@@ -167,8 +398,9 @@ class ImageViewer(QWidget):
 
     def find_matching_dataset_dirs(self, directory):
         """ Find directories matching the dataset names (AI, Dataset, DATASETS, etc.). """
-        return [d for d in os.listdir(directory) 
-                if os.path.isdir(os.path.join(directory, d)) and any(d.lower() == name.lower() for name in DATASET_FOLDER_NAMES)]
+        with os.scandir(directory) as entries:
+            return [entry.name for entry in entries
+                    if entry.name.lower() in DATASET_FOLDER_NAMES_LOWER and entry.is_dir()]
 
     def show_directory_selector_dialog(self, directories):
         """ Show a dialog to select one of the matching directories. """
@@ -196,81 +428,190 @@ class ImageViewer(QWidget):
 
     def start_loading_images(self, directory):
         """ Start loading images from the selected directory. """
-        # Clear the previous images
+        # Clear the previous images and drop thumbnails still queued for decoding
+        QThreadPool.globalInstance().clear()
         self.image_paths.clear()
         self.clear_image_layout()
 
+        # Thumbnails from another directory will not be shown again soon, so free them now
+        if directory != self.current_directory:
+            QPixmapCache.clear()
+        self.current_directory = directory
+
+        # Stop scanning the previous directory; its remaining results are ignored
+        if self.loader_thread is not None:
+            self.loader_thread.requestInterruption()
+
         # Start the image loading in a separate thread
-        self.loader_thread = ImageLoaderThread(directory)
-        self.loader_thread.image_loaded_signal.connect(self.update_images)
+        self.loader_thread = ImageLoaderThread(directory, self)
+        self.loader_thread.image_loaded_signal.connect(self.add_images)
+        self.loader_thread.loading_finished_signal.connect(self.update_images)
+        self.loader_thread.finished.connect(self.on_loader_finished)
         self.loader_thread.start()
 
-    def update_images(self, image_paths, all_loaded):
+    def on_loader_finished(self):
+        """ Release a loader thread once it has stopped running. """
+        thread = self.sender()
+        if thread is self.loader_thread:
+            self.loader_thread = None
+        thread.deleteLater()
+
+    def add_images(self, image_paths):
+        """ Show a batch of image paths as soon as the loader thread finds them. """
+        if self.sender() is not self.loader_thread:
+            return  # Batch from a directory that is no longer selected
+
+        start = len(self.image_paths)
+        self.image_paths.extend(image_paths)
+        self.image_count_label.setText(f"Images Found: {len(self.image_paths)}")
+        self.display_images(start)
+
+    def update_images(self, all_loaded):
         """ Update UI after loading images. """
-        self.image_paths = image_paths
+        if self.sender() is not self.loader_thread:
+            return
+
         if not all_loaded:
             self.image_count_label.setText(f"Too many images. Displaying {MAX_IMAGES_TO_DISPLAY} images.")
         else:
             self.image_count_label.setText(f"Total Images Found: {len(self.image_paths)}")
 
-        # Update the image count in the EpochCalculator
+        # Update the image count in the EpochCalculator and EpochSweep
         main_window.epoch_calculator.update_image_count(len(self.image_paths))
+        main_window.epoch_sweep.update_image_count(len(self.image_paths))
 
-        # Display images
-        self.display_images()
-
-    def load_and_cache_image(self, img_path):
-        """ Cache images to avoid reloading multiple times using QImageReader. """
-        if img_path not in image_cache:
-            try:
-                reader = QImageReader(img_path)
-                reader.setAutoTransform(True)
-                image = reader.read()
-                if image.isNull():
-                    raise Exception("Failed to load image")
-
-                # Force resize to 1920x1080 while maintaining aspect ratio
-                scaled_image = image.scaled(1920, 1080, Qt.KeepAspectRatio)
-                pixmap = QPixmap.fromImage(scaled_image)
-                image_cache[img_path] = pixmap
-            except Exception as e:
-                print(f"Error loading image {img_path}: {e}")
-                return QPixmap()  # Return empty pixmap in case of error
-        return image_cache[img_path]
+    def load_and_cache_image(self, img_path, cell_w):
+        """ Show a cached thumbnail, or decode it in the thread pool if it is not cached yet. """
+        pixmap = QPixmapCache.find(thumbnail_cache_key(img_path, cell_w))
+        if pixmap is not None:
+            self.thumbnail_labels[img_path].setPixmap(pixmap)
+        else:
+            QThreadPool.globalInstance().start(ThumbnailLoader(img_path, cell_w, self.thumbnail_signals))
 
-    def display_images(self):
-        """ Display images dynamically in a grid layout. """
-        row, col = 0, 0
-        for img_path in self.image_paths:
-            pixmap = self.load_and_cache_image(img_path)
-            if pixmap.isNull():
-                continue  # Skip images that failed to load
+    def on_thumbnail_loaded(self, img_path, cell_w, image):
+        """ Convert a decoded thumbnail to a pixmap on the GUI thread and show it. """
+        img_label = self.thumbnail_labels.get(img_path)
+        if img_label is None:
+            return  # Decode from a previous directory that was still running; keep it out of the cache
 
-            img_label = QLabel(self)
-            img_label.setPixmap(pixmap)
-            img_label.setAlignment(Qt.AlignCenter)
-            img_label.mousePressEvent = lambda event, path=img_path: self.view_full_image(path)
+        if image.isNull():
+            print(f"Error loading image {img_path}: Failed to load image")
+            img_label.setText("Failed to load")  # Keep the cell so the grid stays in place
+            return
 
-            self.grid_layout.addWidget(img_label, row, col)
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(thumbnail_cache_key(img_path, cell_w), pixmap)
+        img_label.setPixmap(pixmap)
+
+    def grid_spacing(self, orientation):
+        """ Spacing between grid cells, falling back to the style's label spacing when the layout has none. """
+        spacing = self.grid_layout.horizontalSpacing() if orientation == Qt.Horizontal else self.grid_layout.verticalSpacing()
+        if spacing < 0:
+            spacing = self.style().layoutSpacing(QSizePolicy.Label, QSizePolicy.Label, orientation)
+        return max(spacing, 0)
+
+    def thumbnail_cell_width(self):
+        """ Largest cell edge that fits IMAGES_PER_ROW thumbnails across the scroll area viewport. """
+        margins = self.grid_layout.contentsMargins()
+        spacing = self.grid_spacing(Qt.Horizontal)
+        available_w = self.scroll_area.viewport().width() - margins.left() - margins.right() - (IMAGES_PER_ROW - 1) * spacing
+        cell_w = available_w // IMAGES_PER_ROW
+
+        # The vertical scrollbar only appears once the labels are added; leave room for it if a full grid will not fit
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        rows = (MAX_IMAGES_TO_DISPLAY + IMAGES_PER_ROW - 1) // IMAGES_PER_ROW
+        grid_h = margins.top() + margins.bottom() + rows * cell_w + (rows - 1) * self.grid_spacing(Qt.Vertical)
+        if not scroll_bar.isVisible() and grid_h > self.scroll_area.viewport().height():
+            cell_w = (available_w - scroll_bar.sizeHint().width()) // IMAGES_PER_ROW
+
+        return max(cell_w, MIN_THUMBNAIL_SIZE)
+
+    def display_images(self, start=0):
+        """ Display images dynamically in a grid layout, adding labels from index start onwards. """
+        # Size thumbnails to the grid cell rather than decoding them at full resolution
+        if start == 0:
+            self.thumbnail_cell_w = self.thumbnail_cell_width()
+        cell_w = self.thumbnail_cell_w
+
+        # Suspend painting and layout while the labels are added, then lay out the grid once
+        self.image_frame.setUpdatesEnabled(False)
+        self.grid_layout.setEnabled(False)
+
+        # Bind loop constants to locals to avoid repeated attribute lookups
+        add_widget = self.grid_layout.addWidget
+        thumbnail_labels = self.thumbnail_labels
+        view_full_image = self.view_full_image
+        centered = Qt.AlignCenter
+
+        row, col = divmod(start, IMAGES_PER_ROW)
+        for img_path in self.image_paths[start:]:
+            img_label = ClickableLabel(img_path, self)
+            img_label.setFixedSize(cell_w, cell_w)  # Fixed cells keep every grid row the same height
+            img_label.setAlignment(centered)
+            img_label.clicked.connect(view_full_image)
+
+            add_widget(img_label, row, col)
+            thumbnail_labels[img_path] = img_label
 
             col += 1
-            if col >= 5:  # 5 images per row
+            if col >= IMAGES_PER_ROW:
                 col = 0
                 row += 1
 
+        self.grid_layout.setEnabled(True)
+        self.grid_layout.activate()
+        self.image_frame.setUpdatesEnabled(True)
         self.image_frame.adjustSize()
 
+        # Load the first screen of thumbnails once the grid has been laid out
+        QTimer.singleShot(0, self.load_visible_thumbnails)
+
+    def load_visible_thumbnails(self, *args):
+        """ Load thumbnails only for grid rows that intersect the scroll area viewport. """
+        # Map the viewport rect into grid rows. Labels are fixed-size and never hidden, so once the grid
+        # overflows the viewport every row is exactly one cell plus spacing tall; this avoids reading
+        # label geometry, which is stale while streamed labels are still waiting to be shown
+        visible = self.scroll_area.viewport().rect().translated(-self.image_frame.pos())
+        top_margin = self.grid_layout.contentsMargins().top()
+        row_height = self.thumbnail_cell_w + self.grid_spacing(Qt.Vertical)
+        row_count = (len(self.image_paths) + IMAGES_PER_ROW - 1) // IMAGES_PER_ROW
+        first_row = max((visible.top() - top_margin) // row_height, 0)
+        last_row = min((visible.bottom() - top_margin) // row_height, row_count - 1)
+
+        for index in range(first_row * IMAGES_PER_ROW, min((last_row + 1) * IMAGES_PER_ROW, len(self.image_paths))):
+            if index not in self.materialized_indices:
+                self.materialized_indices.add(index)
+                self.load_and_cache_image(self.image_paths[index], self.thumbnail_cell_w)
+
     def clear_image_layout(self):
         """ Clear the previous images from the layout. """
-        for i in reversed(range(self.grid_layout.count())):
-            widget = self.grid_layout.itemAt(i).widget()
+        self.thumbnail_labels.clear()
+        self.materialized_indices.clear()
+
+        self.image_frame.setUpdatesEnabled(False)
+        while (item := self.grid_layout.takeAt(0)) is not None:
+            widget = item.widget()
             if widget is not None:
+                # Detach immediately so the widget stops painting before deleteLater runs
+                widget.setParent(None)
                 widget.deleteLater()
+        self.image_frame.setUpdatesEnabled(True)
 
     def view_full_image(self, img_path):
         """ View the full image in a new window. """
+        # Decode no larger than the screen; the plugin can subsample large photos while decoding
+        reader = QImageReader(img_path)
+        reader.setAutoTransform(True)
+        size = reader.size()
+        screen_size = QApplication.primaryScreen().availableGeometry().size()
+        if reader.transformation() & QImageIOHandler.TransformationRotate90:
+            screen_size.transpose()  # The stored size is before rotation
+        if size.isValid() and (size.width() > screen_size.width() or size.height() > screen_size.height()):
+            size.scale(screen_size, Qt.KeepAspectRatio)
+            reader.setScaledSize(size)
+
         img_label = QLabel()
-        img_pixmap = QPixmap(img_path)
+        img_pixmap = QPixmap.fromImage(reader.read())
         img_label.setPixmap(img_pixmap)
         img_label.setAlignment(Qt.AlignCenter)
 
@@ -294,8 +635,9 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Epoch Calculator with Image Viewer")
         self.setGeometry(100, 100, 1024, 768)
 
-        # Set the icon for the window
-        self.setWindowIcon(QIcon('F:/Tools/Epoch Calc/heart_icons/default.ico'))  # Add your icon path here
+        # Set the icon for the window, if it is available
+        if os.path.isfile(ICON_PATH):
+            self.setWindowIcon(QIcon(ICON_PATH))
 
         # Set up the main layout
         self.layout = QVBoxLayout()
@@ -307,6 +649,10 @@ class MainWindow(QMainWindow):
         self.epoch_calculator = EpochCalculator()
         self.tabs.addTab(self.epoch_calculator, "Epoch Calculator")
 
+        # Add the Epoch Sweep tab
+        self.epoch_sweep = EpochSweep()
+        self.tabs.addTab(self.epoch_sweep, "Sweep")
+
         # Add the Image Viewer tab
         self.image_viewer = ImageViewer()
         self.tabs.addTab(self.image_viewer, "Image Viewer")
@@ -341,6 +687,7 @@ class MainWindow(QMainWindow):
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
     main_window = MainWindow()
     main_window.show()
     sys.exit(app.exec_())